@@ -7,14 +7,13 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 from langchain.schema import HumanMessage, SystemMessage
 import uuid
-import os
+import weakref
 import logging
 from datetime import datetime
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from cachetools import TTLCache
 
+from ..config import get_settings
 from ..state import ConversationState
 from ..llm import get_default_llm
 
@@ -25,6 +24,18 @@ from ..llm import get_default_llm
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Recent recall() results per memory client, keyed by normalized query. Agents
+# sharing a client share its cache, so a write by one invalidates it for all.
+_recall_caches: "weakref.WeakKeyDictionary[Any, TTLCache]" = weakref.WeakKeyDictionary()
+
+
+def _recall_cache_for(memory_client) -> TTLCache:
+    """Return the recall cache shared by every agent using memory_client"""
+    cache = _recall_caches.get(memory_client)
+    if cache is None:
+        cache = _recall_caches[memory_client] = TTLCache(maxsize=256, ttl=60)
+    return cache
+
 
 class BaseAgent(ABC):
     """Base class for all specialized agents in Mohit's Personal AI Brain"""
@@ -35,7 +46,8 @@ class BaseAgent(ABC):
                  tools: List[str], 
                  authority_level: str,
                  system_prompt: str = None,
-                 supergateway_url: str = "http://localhost:3004"):
+                 supergateway_url: Optional[str] = None,
+                 memory_client=None):
         """
         Initialize base agent with memory integration
         
@@ -45,14 +57,15 @@ class BaseAgent(ABC):
             tools: List of MCP tools this agent can use
             authority_level: Decision-making authority ("low", "medium", "high")
             system_prompt: Custom system prompt for agent personality
-            supergateway_url: URL for supergateway-memory service
+            supergateway_url: URL for supergateway-memory service (defaults to SUPERGATEWAY_URL)
+            memory_client: Connected memory client, shared with other agents to reuse its connections
         """
         self.role = role
         self.personality = personality
         self.available_tools = tools
         self.decision_authority = authority_level
         self.agent_id = f"{role}_{uuid.uuid4().hex[:8]}"
-        self.supergateway_url = supergateway_url
+        self.supergateway_url = supergateway_url or get_settings().supergateway_url
         
         # Initialize LLM for this agent using flexible configuration
         self.llm = get_default_llm(
@@ -60,8 +73,8 @@ class BaseAgent(ABC):
             temperature=self._get_agent_temperature()
         )
         
-        # Initialize memory client (placeholder - will be replaced with real MCP)
-        self.memory_client = None  # MemoryClientDirect()
+        # Memory client is injected by the owner so agents share one connection
+        self.memory_client = memory_client
         self.memory_initialized = False
         
         # Build system prompt
@@ -106,7 +119,7 @@ Respond in character with your specialized expertise."""
         pass
     
     @abstractmethod
-    def should_handle_request(self, request: str, context: Dict[str, Any]) -> float:
+    async def should_handle_request(self, request: str, context: Dict[str, Any]) -> float:
         """
         Determine if this agent should handle the request
         
@@ -233,11 +246,16 @@ Respond in JSON format:
     async def initialize_memory(self) -> bool:
         """Initialize memory integration for this agent"""
         # Check if memory is enabled
-        if os.getenv("ENABLE_MEMORY", "false").lower() != "true":
+        if not get_settings().enable_memory:
             logger.info(f"Agent {self.agent_id}: Memory service disabled by configuration")
             self.memory_initialized = False
             return False
             
+        if self.memory_client is None:
+            logger.info(f"Agent {self.agent_id}: No memory client configured, proceeding without persistence")
+            self.memory_initialized = False
+            return False
+            
         try:
             # Test memory connectivity
             health = await self.memory_client.health_check()
@@ -307,6 +325,7 @@ Respond in JSON format:
             )
             
             logger.info(f"Agent {self.agent_id} stored memory: {content[:100]}...")
+            _recall_cache_for(self.memory_client).clear()
             return True
             
         except Exception as e:
@@ -317,6 +336,13 @@ Respond in JSON format:
         """Search and recall relevant memories"""
         if not self.memory_initialized:
             return []
+        
+        # Repeated queries within the TTL skip the memory service entirely
+        recall_cache = _recall_cache_for(self.memory_client)
+        cache_key = (query.strip().lower(), limit)
+        cached = recall_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
             
         try:
             search_result = await self.memory_client.search_memories(
@@ -324,9 +350,12 @@ Respond in JSON format:
                 limit=limit
             )
             memories = search_result.get('memories', [])
+            # A failed search is not cached, so the next call retries it
+            if "error" not in search_result:
+                recall_cache[cache_key] = memories
             
             logger.info(f"Agent {self.agent_id} recalled {len(memories)} memories for query: {query}")
-            return memories
+            return list(memories)
             
         except Exception as e:
             logger.error(f"Failed to recall memories: {str(e)}")
@@ -362,6 +391,7 @@ Respond in JSON format:
             )
             
             logger.info(f"Agent {self.agent_id} created entity: {name}")
+            _recall_cache_for(self.memory_client).clear()
             return True
             
         except Exception as e:
@@ -4,6 +4,7 @@ Analytical and detail-oriented agent with structured reasoning for data analysis
 """
 
 from typing import Dict, List, Any, Optional
+from functools import lru_cache
 import json
 import logging
 
@@ -12,6 +13,36 @@ from .react_base_agent import ReActBaseAgent, ActionType
 
 logger = logging.getLogger(__name__)
 
+# Requests the Data Analyst is the best fit for
+DATA_KEYWORDS = (
+    "analyze", "data", "statistics", "report", "chart", "graph",
+    "trend", "metric", "dashboard", "visualize"
+)
+
+# Business intelligence requests the Data Analyst can take on
+BI_KEYWORDS = (
+    "business", "intelligence", "insights", "performance", "forecast", "prediction"
+)
+
+# Data Analyst requests that need structured (ReAct) analysis
+DA_COMPLEXITY_INDICATORS = (
+    # Multi-step analysis
+    "analyze and visualize", "explore and report",
+    "investigate patterns", "deep dive",
+
+    # Complex calculations
+    "statistical analysis", "correlation", "regression",
+    "forecast", "predict", "model",
+
+    # Multiple data sources
+    "combine data", "merge datasets", "cross-reference",
+    "multiple sources", "integrate data",
+
+    # Detailed reporting
+    "comprehensive report", "detailed analysis",
+    "executive summary", "insights and recommendations"
+)
+
 
 class DataAnalystAgent(BaseAgent, ReActBaseAgent):
     """
@@ -19,7 +50,7 @@ class DataAnalystAgent(BaseAgent, ReActBaseAgent):
     Uses structured analysis approach for complex data problems
     """
     
-    def __init__(self):
+    def __init__(self, memory_client=None):
         # Initialize base agent with Data Analyst configuration
         BaseAgent.__init__(
             self,
@@ -30,7 +61,8 @@ class DataAnalystAgent(BaseAgent, ReActBaseAgent):
                 "data_analysis", "reporting", "memory"
             ],
             authority_level="medium",
-            system_prompt=self._build_data_analyst_prompt()
+            system_prompt=self._build_data_analyst_prompt(),
+            memory_client=memory_client
         )
         
         # Configure ReAct for analytical tasks
@@ -124,6 +156,28 @@ Always support conclusions with data and provide actionable insights."""
                 "error": react_result.get("error")
             }
     
+    async def should_handle_request(self, request: str, context: Dict[str, Any]) -> float:
+        """Determine if this agent should handle the request"""
+        return self._score_prompt(request)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _score_prompt(request: str) -> float:
+        """Keyword-based confidence score; pure, so repeated requests are memoized"""
+        
+        request_lower = request.lower()
+        
+        # High confidence for data analysis keywords
+        if any(keyword in request_lower for keyword in DATA_KEYWORDS):
+            return 0.9
+        
+        # Medium confidence for business intelligence
+        if any(keyword in request_lower for keyword in BI_KEYWORDS):
+            return 0.7
+        
+        # Low confidence otherwise
+        return 0.1
+    
     def _determine_analysis_type(self, request: str) -> str:
         """Determine the type of analysis needed"""
         request_lower = request.lower()
@@ -144,29 +198,10 @@ Always support conclusions with data and provide actionable insights."""
     async def should_use_react(self, request: str, context: Dict[str, Any]) -> bool:
         """Determine if request requires structured analysis"""
         
-        # Data Analyst specific indicators
-        da_complexity_indicators = [
-            # Multi-step analysis
-            "analyze and visualize", "explore and report",
-            "investigate patterns", "deep dive",
-            
-            # Complex calculations
-            "statistical analysis", "correlation", "regression",
-            "forecast", "predict", "model",
-            
-            # Multiple data sources
-            "combine data", "merge datasets", "cross-reference",
-            "multiple sources", "integrate data",
-            
-            # Detailed reporting
-            "comprehensive report", "detailed analysis",
-            "executive summary", "insights and recommendations"
-        ]
-        
         request_lower = request.lower()
         
         # Check DA-specific indicators
-        if any(indicator in request_lower for indicator in da_complexity_indicators):
+        if any(indicator in request_lower for indicator in DA_COMPLEXITY_INDICATORS):
             return True
         
         # Check if data volume suggests complexity
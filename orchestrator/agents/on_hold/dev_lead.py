@@ -66,7 +66,7 @@ class DevLeadAgent(BaseAgent):
             "context_updated": True
         }
     
-    def should_handle_request(self, request: str, context: Dict[str, Any]) -> float:
+    async def should_handle_request(self, request: str, context: Dict[str, Any]) -> float:
         """Determine if this agent should handle the request"""
         request_lower = request.lower()
         
@@ -63,7 +63,7 @@ class HRDirectorAgent(BaseAgent):
             "context_updated": True
         }
     
-    def should_handle_request(self, request: str, context: Dict[str, Any]) -> float:
+    async def should_handle_request(self, request: str, context: Dict[str, Any]) -> float:
         """Determine if this agent should handle the request"""
         request_lower = request.lower()
         
@@ -126,7 +126,7 @@ Always be proactive, organized, and focused on making Mohit's life easier."""
         
         return any(re.match(pattern, request_lower) for pattern in simple_patterns)
     
-    def should_handle_request(self, request: str, context: Dict[str, Any]) -> float:
+    async def should_handle_request(self, request: str, context: Dict[str, Any]) -> float:
         """Personal Assistant can handle most requests or coordinate for complex ones"""
         
         # Personal Assistant has high confidence for most requests
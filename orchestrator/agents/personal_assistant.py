@@ -4,6 +4,7 @@ Combines proactive personality with structured reasoning for complex tasks
 """
 
 from typing import Dict, List, Any, Optional
+from functools import lru_cache
 import json
 import logging
 
@@ -12,6 +13,37 @@ from .react_base_agent import ReActBaseAgent, ActionType
 
 logger = logging.getLogger(__name__)
 
+# Requests the Personal Assistant handles itself as coordinator
+COORDINATION_KEYWORDS = (
+    "coordinate", "organize", "schedule", "plan", "prepare",
+    "remind", "brief", "summary", "status", "update"
+)
+
+# Requests the Personal Assistant takes on to delegate to a specialist
+DELEGATION_KEYWORDS = (
+    "analyze", "data", "report", "technical", "code", "infrastructure",
+    "hr", "employee", "team", "hiring", "policy"
+)
+
+# Personal Assistant requests that need ReAct reasoning
+PA_COMPLEXITY_INDICATORS = (
+    # Multi-agent coordination
+    "coordinate with", "work with", "involve multiple",
+    "across teams", "different departments",
+
+    # Complex planning
+    "create a plan", "develop strategy", "organize project",
+    "schedule multiple", "complex workflow",
+
+    # Analysis requiring multiple steps
+    "analyze and report", "investigate and summarize",
+    "research and present", "gather and compile",
+
+    # Decision making
+    "help me decide", "what should i", "recommend based on",
+    "evaluate options", "compare alternatives"
+)
+
 
 class PersonalAssistantAgent(BaseAgent, ReActBaseAgent):
     """
@@ -19,7 +51,7 @@ class PersonalAssistantAgent(BaseAgent, ReActBaseAgent):
     Uses structured thought-action-observation for complex coordination
     """
     
-    def __init__(self):
+    def __init__(self, memory_client=None):
         # Initialize base agent with Personal Assistant configuration
         BaseAgent.__init__(
             self,
@@ -30,7 +62,8 @@ class PersonalAssistantAgent(BaseAgent, ReActBaseAgent):
                 "memory", "filesystem", "communication"
             ],
             authority_level="high",
-            system_prompt=self._build_personal_assistant_prompt()
+            system_prompt=self._build_personal_assistant_prompt(),
+            memory_client=memory_client
         )
         
         # Add ReAct configuration
@@ -119,32 +152,35 @@ Always be proactive, organized, and focused on making Mohit's life easier."""
             logger.warning(f"ReAct reasoning failed: {react_result.get('error')}")
             return await self.handle_request_with_memory(request, context)
     
+    async def should_handle_request(self, request: str, context: Dict[str, Any]) -> float:
+        """Personal Assistant can handle most requests or coordinate for complex ones"""
+        return self._score_prompt(request)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _score_prompt(request: str) -> float:
+        """Keyword-based confidence score; pure, so repeated requests are memoized"""
+        
+        request_lower = request.lower()
+        
+        # High confidence for coordination tasks
+        if any(keyword in request_lower for keyword in COORDINATION_KEYWORDS):
+            return 0.9
+        
+        # Medium-high confidence for delegation tasks
+        if any(keyword in request_lower for keyword in DELEGATION_KEYWORDS):
+            return 0.8
+        
+        # Default medium confidence as coordinator
+        return 0.7
+    
     async def should_use_react(self, request: str, context: Dict[str, Any]) -> bool:
         """Determine if request requires ReAct reasoning"""
         
-        # Personal Assistant specific complexity indicators
-        pa_complexity_indicators = [
-            # Multi-agent coordination
-            "coordinate with", "work with", "involve multiple",
-            "across teams", "different departments",
-            
-            # Complex planning
-            "create a plan", "develop strategy", "organize project",
-            "schedule multiple", "complex workflow",
-            
-            # Analysis requiring multiple steps
-            "analyze and report", "investigate and summarize",
-            "research and present", "gather and compile",
-            
-            # Decision making
-            "help me decide", "what should i", "recommend based on",
-            "evaluate options", "compare alternatives"
-        ]
-        
         request_lower = request.lower()
         
         # Check PA-specific indicators
-        if any(indicator in request_lower for indicator in pa_complexity_indicators):
+        if any(indicator in request_lower for indicator in PA_COMPLEXITY_INDICATORS):
             return True
         
         # Use base class logic as well
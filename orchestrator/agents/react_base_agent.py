@@ -19,6 +19,14 @@ from ..llm.config import get_default_llm
 logger = logging.getLogger(__name__)
 
 
+# Default heuristics for requests that need the ReAct pattern
+COMPLEXITY_INDICATORS = (
+    "analyze", "calculate", "compare", "investigate",
+    "research", "find out", "determine", "figure out",
+    "multiple", "steps", "complex", "detailed"
+)
+
+
 class ActionType(Enum):
     """Types of actions in ReAct pattern"""
     THINK = "think"
@@ -322,17 +330,11 @@ Based on this observation, what should be the next step? Continue reasoning."""
         Determine if request requires ReAct pattern
         Override in subclass for agent-specific logic
         """
-        # Default heuristics for complexity
-        complexity_indicators = [
-            "analyze", "calculate", "compare", "investigate",
-            "research", "find out", "determine", "figure out",
-            "multiple", "steps", "complex", "detailed"
-        ]
         
         request_lower = request.lower()
         
         # Check for complexity indicators
-        if any(indicator in request_lower for indicator in complexity_indicators):
+        if any(indicator in request_lower for indicator in COMPLEXITY_INDICATORS):
             return True
         
         # Check if context suggests complexity
@@ -4,18 +4,15 @@ Transformed to use specialized agents with LangGraph coordination
 """
 
 from langgraph.graph import StateGraph, END
-from langchain_openai import ChatOpenAI
+from langchain_core.runnables import RunnableConfig
 from typing import Dict, Any
+from datetime import datetime
+import time
 import uuid
-import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
-
-from .state import ConversationState
-from .nodes.intent_analyzer import IntentAnalyzer
-from .nodes.planner import WorkflowPlanner
+from .state import ConversationState, ConversationStateDict, MAX_MESSAGES
+from .llm import make_chat
+from .nodes.intent_and_plan import IntentPlanner
 from .nodes.executor_simple import ToolExecutor
 from .nodes.responder import ResponseGenerator
 # Memory client will be injected through proper MCP connection
@@ -25,12 +22,11 @@ from .coordination.agent_router import AgentRouter
 class PersonalAIBrain:
     """Multi-Agent Personal AI Brain for Mohit - Orchestration with specialized agents"""
     
+    # Compiled LangGraph workflow, shared by every brain instance
+    _compiled_graph = None
+    
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.1,
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+        self.llm = make_chat(model="gpt-4", temperature=0.1)
         
         # Initialize multi-agent system
         self.agent_router = AgentRouter()
@@ -39,22 +35,30 @@ class PersonalAIBrain:
         self.memory = None  # Will be set up with MCP Supergateway
         
         # Initialize nodes (legacy - will be replaced by agent-specific processing)
-        self.intent_analyzer = IntentAnalyzer(self.llm)
-        self.planner = WorkflowPlanner(self.llm)
+        self.intent_planner = IntentPlanner(self.llm)  # intent analysis and planning in one call
         self.executor = ToolExecutor(self.memory)  # Pass memory client instead
         self.responder = ResponseGenerator(self.llm)
         
-        # Build the graph (enhanced for multi-agent coordination)
-        self.graph = self._build_graph()
+        # Build the graph once per process (enhanced for multi-agent coordination)
+        self.graph = self._get_graph()
     
-    def _build_graph(self) -> StateGraph:
+    @classmethod
+    def _get_graph(cls):
+        """Return the compiled workflow, compiling it on first use"""
+        if cls._compiled_graph is None:
+            cls._compiled_graph = cls._build_graph()
+        return cls._compiled_graph
+    
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         """Build the enhanced LangGraph workflow with multi-agent coordination"""
         
-        workflow = StateGraph(ConversationState)
+        workflow = StateGraph(ConversationStateDict)
         
         # Add enhanced nodes with agent coordination
-        workflow.add_node("route_to_agent", self._route_to_agent_node)
-        workflow.add_node("agent_processing", self._agent_processing_node)
+        # Nodes are unbound; the brain instance is passed in via the run config
+        workflow.add_node("route_to_agent", cls._route_to_agent_node)
+        workflow.add_node("agent_processing", cls._agent_processing_node)
         
         # Optional memory nodes (will gracefully skip if memory service unavailable)
         # workflow.add_node("retrieve_memory", self.memory.retrieve_context)
@@ -74,43 +78,55 @@ class PersonalAIBrain:
         
         return workflow.compile()
     
-    async def _route_to_agent_node(self, state: ConversationState) -> ConversationState:
+    @staticmethod
+    async def _route_to_agent_node(state: ConversationStateDict, config: RunnableConfig) -> Dict[str, Any]:
         """Node for routing request to appropriate agent"""
         
+        brain = config["configurable"]["brain"]
+        context = state.get("context", {})
+        
         # Route through agent router
-        agent_response = await self.agent_router.route_request(
-            request=state.current_message,
-            user_id=state.user_id,
-            interface=state.interface,
-            context=state.context
+        agent_response = await brain.agent_router.route_request(
+            request=state["current_message"],
+            user_id=state["user_id"],
+            interface=state["interface"],
+            context=context
         )
         
         # Store agent routing information in state
-        state.context["agent_response"] = agent_response
-        state.context["selected_agent"] = agent_response.get("selected_agent", agent_response.get("agent", "unknown"))
-        state.context["agent_info"] = {
+        context["agent_response"] = agent_response
+        context["selected_agent"] = agent_response.get("selected_agent", agent_response.get("agent", "unknown"))
+        context["agent_info"] = {
             "routing_confidence": agent_response.get("routing_confidence", 0.0),
             "coordination_required": agent_response.get("coordination_required", False)
         }
         
-        return state
+        # Return only the changed keys - LangGraph merges them into the state
+        return {"context": context}
     
-    async def _agent_processing_node(self, state: ConversationState) -> ConversationState:
+    @staticmethod
+    async def _agent_processing_node(state: ConversationStateDict) -> Dict[str, Any]:
         """Node for agent-specific processing and response generation"""
         
-        agent_response = state.context.get("agent_response", {})
+        agent_response = state["context"].get("agent_response", {})
         
         # Set the response from the agent
-        state.response = agent_response.get("response", "No response from agent")
-        
-        # Track actions taken by the agent
-        state.actions_taken = agent_response.get("actions_taken", [])
+        response = agent_response.get("response", "No response from agent")
         
         # Add agent message to conversation
-        selected_agent = state.context.get("selected_agent", "unknown")
-        state.add_message("assistant", state.response)
+        messages = state.get("messages", [])[-(MAX_MESSAGES - 1):] + [{
+            "role": "assistant",
+            "content": response,
+            "timestamp": datetime.now().isoformat()
+        }]
         
-        return state
+        return {
+            "response": response,
+            # Track actions taken by the agent
+            "actions_taken": agent_response.get("actions_taken", []),
+            "messages": messages,
+            "last_updated": time.monotonic()
+        }
     
     async def process_request(self, message: str, user_id: str, interface: str, 
                             session_id: str = None, context: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -128,32 +144,20 @@ class PersonalAIBrain:
         state.add_message("user", message)
         
         try:
-            # Run through the graph
-            result = await self.graph.ainvoke(state)
+            # Run through the graph - LangGraph returns the final state as a dict
+            final_state = await self.graph.ainvoke(
+                state.to_dict(),
+                config={"configurable": {"brain": self}}
+            )
             
-            # Extract the final state from the result
-            # LangGraph returns a dictionary, not a ConversationState object
-            if isinstance(result, dict):
-                final_state = result
-                return {
-                    "response": final_state.get("response", ""),
-                    "agent": final_state.get("context", {}).get("selected_agent", "unknown"),
-                    "actions_taken": final_state.get("actions_taken", []),
-                    "context_updated": len(final_state.get("actions_taken", [])) > 0,
-                    "session_id": final_state.get("session_id", ""),
-                    "multi_agent_info": final_state.get("context", {}).get("agent_info", {})
-                }
-            else:
-                # Fallback for state objects
-                final_state = result if hasattr(result, 'response') else state
-                return {
-                    "response": final_state.response,
-                    "agent": final_state.context.get("selected_agent", "unknown"),
-                    "actions_taken": final_state.actions_taken,
-                    "context_updated": len(final_state.actions_taken) > 0,
-                    "session_id": final_state.session_id,
-                    "multi_agent_info": final_state.context.get("agent_info", {})
-                }
+            return {
+                "response": final_state.get("response", ""),
+                "agent": final_state.get("context", {}).get("selected_agent", "unknown"),
+                "actions_taken": final_state.get("actions_taken", []),
+                "context_updated": len(final_state.get("actions_taken", [])) > 0,
+                "session_id": final_state.get("session_id", ""),
+                "multi_agent_info": final_state.get("context", {}).get("agent_info", {})
+            }
             
         except Exception as e:
             return {
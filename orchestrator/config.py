@@ -0,0 +1,31 @@
+"""
+Application Settings
+Environment configuration read once per process
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable snapshot of the environment configuration"""
+    
+    openai_api_key: Optional[str]
+    supergateway_url: str
+    enable_memory: bool
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load .env into the environment once and return the cached settings"""
+    load_dotenv()
+    
+    return Settings(
+        openai_api_key=os.environ.get("OPENAI_API_KEY"),
+        supergateway_url=os.environ.get("SUPERGATEWAY_URL", "http://localhost:3004"),
+        enable_memory=os.environ.get("ENABLE_MEMORY", "false").lower() == "true"
+    )
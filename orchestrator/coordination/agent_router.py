@@ -4,16 +4,12 @@ Core coordination component for Mohit's Personal AI Brain
 """
 
 from typing import Dict, List, Any, Optional, Tuple
-from langchain_openai import ChatOpenAI
 from langchain.schema import HumanMessage, SystemMessage
 import asyncio
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+import orjson
 
 from ..agents.base_agent import BaseAgent
+from ..llm import make_chat
 
 # Import agents (now with ReAct built-in)
 from ..agents.personal_assistant import PersonalAssistantAgent
@@ -30,16 +26,18 @@ class AgentRouter:
     Routes user requests to the most appropriate agent(s) in the multi-agent system
     """
     
-    def __init__(self):
+    def __init__(self, memory_client=None):
         self.agents: Dict[str, BaseAgent] = {}
         self.primary_agent: Optional[BaseAgent] = None
         
         # LLM for routing decisions
-        self.routing_llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.1,
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+        self.routing_llm = make_chat(model="gpt-4", temperature=0.1)
+        
+        # Agent scoring stops early once any agent is at least this confident
+        self.routing_confidence_threshold = 0.95
+        
+        # One memory client shared by every agent, so they reuse its connections
+        self.memory_client = memory_client
         
         # Initialize with Personal Assistant as primary agent
         self._initialize_agents()
@@ -48,11 +46,11 @@ class AgentRouter:
         """Initialize the agent system with Personal Assistant as coordinator"""
         
         # Create Personal Assistant as primary coordinator
-        personal_assistant = PersonalAssistantAgent()
+        personal_assistant = PersonalAssistantAgent(memory_client=self.memory_client)
         self.register_agent(personal_assistant, is_primary=True)
         
         # Add specialist agents
-        self.register_agent(DataAnalystAgent())
+        self.register_agent(DataAnalystAgent(memory_client=self.memory_client))
         
         # These agents are on hold until ReAct implementation is added
         # self.register_agent(HRDirectorAgent()) 
@@ -113,6 +111,44 @@ class AgentRouter:
         # Fallback if no primary agent (shouldn't happen in normal operation)
         return await self._emergency_fallback_response(request, context)
     
+    async def route_requests(self,
+                           requests: List[str],
+                           user_id: str,
+                           interface: str,
+                           context: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Route several independent requests concurrently
+        
+        The requests share the LLM connection pools of the running loop, so their
+        model calls overlap instead of running back to back.
+        
+        Args:
+            requests: User messages/requests
+            user_id: User identifier
+            interface: Interface used (voice, whatsapp, web, etc.)
+            context: Additional context, copied for each request
+            
+        Returns:
+            One response per request, in the same order
+        """
+        
+        results = await asyncio.gather(
+            *(self.route_request(request, user_id, interface, dict(context or {}))
+              for request in requests),
+            return_exceptions=True
+        )
+        
+        # A failing request does not discard the responses of the others
+        return [
+            {
+                "response": "I apologize, Mohit, but I encountered an error processing this request.",
+                "agent": "router",
+                "actions_taken": [],
+                "error": str(result)
+            } if isinstance(result, Exception) else result
+            for result in results
+        ]
+    
     async def _sophisticated_routing(self, 
                                    request: str, 
                                    context: Dict[str, Any]) -> Tuple[BaseAgent, float]:
@@ -121,16 +157,27 @@ class AgentRouter:
         (Will be implemented in later phases)
         """
         
-        # Get confidence scores from each agent
-        agent_scores = {}
+        # Score every agent concurrently so I/O-bound scoring overlaps
+        tasks = {
+            asyncio.ensure_future(agent.should_handle_request(request, context)): role
+            for role, agent in self.agents.items()
+        }
+        agent_scores = {role: 0.0 for role in self.agents}
+        pending = set(tasks)
         
-        for role, agent in self.agents.items():
-            try:
-                confidence = agent.should_handle_request(request, context)
-                agent_scores[role] = confidence
-            except Exception as e:
-                # Agent failed to evaluate - low confidence
-                agent_scores[role] = 0.0
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    # Agent failed to evaluate - low confidence
+                    agent_scores[tasks[task]] = 0.0 if task.exception() else task.result()
+                
+                # Short-circuit once an agent is confident enough
+                if max(agent_scores.values()) >= self.routing_confidence_threshold:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
         
         # Select agent with highest confidence
         best_agent_role = max(agent_scores, key=agent_scores.get)
@@ -187,9 +234,8 @@ Respond in JSON:
         response = await self.routing_llm.ainvoke(messages)
         
         try:
-            import json
-            return json.loads(response.content)
-        except:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
             # Fallback to Personal Assistant
             return {
                 "primary_agent": "personal_assistant",
@@ -4,14 +4,25 @@ LLM Configuration Module
 
 from .config import (
     get_default_llm,
+    make_chat,
+    get_http_clients,
     switch_provider,
-    get_available_providers,
-    llm_config
+    get_available_providers
 )
+from . import config as _config
 
 __all__ = [
     'get_default_llm',
+    'make_chat',
+    'get_http_clients',
     'switch_provider',
     'get_available_providers',
     'llm_config'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # llm_config is created on first access, not when the package is imported
+    if name == "llm_config":
+        return _config.llm_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,18 +4,37 @@ Supports multiple LLM providers and easy switching
 """
 
 import os
-from typing import Any, Dict, Optional
+import asyncio
+import hashlib
+from typing import Any, Dict, Optional, Tuple
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.schema.language_model import BaseLanguageModel
-from dotenv import load_dotenv
 import logging
 
-load_dotenv()
+from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Connection pools shared by every OpenAI chat client, so concurrent LLM calls
+# reuse keep-alive HTTP/2 connections instead of each client opening its own
+# TLS sessions. Both are created on first use (see get_http_clients).
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=64)
+_shared_http: Optional[httpx.Client] = None
+
+# Async pools keep connections bound to the event loop that opened them, so
+# there is one per running loop
+_shared_async_http: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+# Constructed LLM clients keyed by their full configuration, so identical
+# configurations share one adapter (and its connection pool)
+_client_cache: Dict[Tuple, BaseLanguageModel] = {}
+
+# Parameters that carry credentials; only their hash goes into the cache key
+_API_KEY_PARAMS = ("api_key", "anthropic_api_key", "google_api_key")
+
 
 class LLMConfig:
     """Central configuration for LLM providers"""
@@ -40,6 +59,8 @@ class LLMConfig:
     }
     
     def __init__(self):
+        # .env is loaded once per process by the cached application settings
+        get_settings()
         self.provider = os.getenv("LLM_PROVIDER", "openai").lower()
         self.model = os.getenv("LLM_MODEL", "gpt-4")
         self.temperature = float(os.getenv("LLM_TEMPERATURE", "0.1"))
@@ -47,6 +68,9 @@ class LLMConfig:
         
         # Validate configuration
         self._validate_config()
+        
+        # Snapshot the API key once; get_llm reuses it on every call
+        self._api_key = os.getenv(self.PROVIDERS[self.provider]["env_key"])
     
     def _validate_config(self):
         """Validate the LLM configuration"""
@@ -54,9 +78,8 @@ class LLMConfig:
             raise ValueError(f"Unsupported LLM provider: {self.provider}. Supported: {list(self.PROVIDERS.keys())}")
         
         provider_info = self.PROVIDERS[self.provider]
-        api_key = os.getenv(provider_info["env_key"])
         
-        if not api_key:
+        if not os.getenv(provider_info["env_key"]):
             raise ValueError(f"Missing API key for {self.provider}. Please set {provider_info['env_key']} in .env")
         
         if self.model not in provider_info["models"]:
@@ -74,7 +97,7 @@ class LLMConfig:
         """
         provider_info = self.PROVIDERS[self.provider]
         llm_class = provider_info["class"]
-        api_key = os.getenv(provider_info["env_key"])
+        api_key = self._api_key
         
         # Default parameters
         params = {
@@ -86,6 +109,7 @@ class LLMConfig:
         # Provider-specific parameters
         if self.provider == "openai":
             params["api_key"] = api_key
+            params.update(get_http_clients())
         elif self.provider == "anthropic":
             params["anthropic_api_key"] = api_key
         elif self.provider == "google":
@@ -95,8 +119,25 @@ class LLMConfig:
         # Override with any provided kwargs
         params.update(kwargs)
         
-        logger.info(f"Creating {self.provider} LLM with model {params.get('model', self.model)}")
-        return llm_class(**params)
+        # Reuse an existing client for an identical configuration
+        cache_key = self._cache_key(params)
+        llm = _client_cache.get(cache_key)
+        if llm is None:
+            logger.info(f"Creating {self.provider} LLM with model {params.get('model', self.model)}")
+            llm = _client_cache[cache_key] = llm_class(**params)
+        return llm
+    
+    def _cache_key(self, params: Dict[str, Any]) -> Tuple:
+        """Build a hashable client cache key without storing plaintext API keys"""
+        secret = "".join(str(params.get(name) or "") for name in _API_KEY_PARAMS)
+        return (
+            self.provider,
+            hashlib.sha256(secret.encode()).hexdigest(),
+            tuple(sorted(
+                (name, repr(value)) for name, value in params.items()
+                if name not in _API_KEY_PARAMS
+            ))
+        )
     
     def get_config_info(self) -> Dict[str, Any]:
         """Get current configuration information"""
@@ -110,8 +151,55 @@ class LLMConfig:
         }
 
 
-# Global configuration instance
-llm_config = LLMConfig()
+# Global configuration instance, created on first use (see _get_config)
+_llm_config: Optional[LLMConfig] = None
+
+
+def _get_config() -> LLMConfig:
+    """Return the global configuration, reading the environment on first use"""
+    global _llm_config
+    if _llm_config is None:
+        _llm_config = LLMConfig()
+    return _llm_config
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily created module attribute llm_config"""
+    if name == "llm_config":
+        return _get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_http_clients() -> Dict[str, Any]:
+    """
+    Get the shared HTTP/2 clients as OpenAI client parameters
+    
+    The async client belongs to the running event loop. Outside a running
+    loop only the sync client is returned and the OpenAI client creates its
+    own async client.
+    
+    Returns:
+        Dict with "http_client" and, inside an event loop, "http_async_client"
+    """
+    global _shared_http
+    if _shared_http is None:
+        _shared_http = httpx.Client(http2=True, limits=_HTTP_LIMITS)
+    clients = {"http_client": _shared_http}
+    
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return clients
+    
+    # Pools of finished loops can no longer be used (e.g. after asyncio.run)
+    for closed in [other for other in _shared_async_http if other.is_closed()]:
+        del _shared_async_http[closed]
+    
+    async_http = _shared_async_http.get(loop)
+    if async_http is None:
+        async_http = _shared_async_http[loop] = httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS)
+    clients["http_async_client"] = async_http
+    return clients
 
 
 def get_default_llm(**kwargs) -> BaseLanguageModel:
@@ -124,7 +212,27 @@ def get_default_llm(**kwargs) -> BaseLanguageModel:
     Returns:
         Configured LLM instance
     """
-    return llm_config.get_llm(**kwargs)
+    return _get_config().get_llm(**kwargs)
+
+
+def make_chat(model: str = "gpt-4", **kwargs) -> ChatOpenAI:
+    """
+    Create an OpenAI chat model on the shared HTTP connection pools
+    
+    Args:
+        model: OpenAI model name
+        **kwargs: Additional ChatOpenAI parameters (temperature, etc.)
+        
+    Returns:
+        ChatOpenAI instance
+    """
+    params = {
+        "model": model,
+        "api_key": get_settings().openai_api_key,
+        **get_http_clients()
+    }
+    params.update(kwargs)
+    return ChatOpenAI(**params)
 
 
 def switch_provider(provider: str, model: Optional[str] = None):
@@ -135,7 +243,7 @@ def switch_provider(provider: str, model: Optional[str] = None):
         provider: New provider name
         model: Optional model name (uses default if not provided)
     """
-    global llm_config
+    global _llm_config
     
     # Update environment variables
     os.environ["LLM_PROVIDER"] = provider
@@ -143,7 +251,7 @@ def switch_provider(provider: str, model: Optional[str] = None):
         os.environ["LLM_MODEL"] = model
     
     # Recreate configuration
-    llm_config = LLMConfig()
+    _llm_config = LLMConfig()
     logger.info(f"Switched to {provider} provider" + (f" with model {model}" if model else ""))
 
 
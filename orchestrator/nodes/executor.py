@@ -2,10 +2,87 @@
 Tool Execution Node - Executes planned steps using MCP servers
 """
 
-from typing import Dict, Any
+import asyncio
+import json
+import re
+import sys
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Optional, Union
 from ..state import ConversationState
 from ..clients.supergateway_client import SupergatewayClient
 
+# Reference to an earlier step's result inside a plan step ("$step_2")
+_STEP_REF_RE = re.compile(r"\$step_(\d+)\b")
+
+# "[Tool]: [Action] - [Details]", split at the first ":" and the first " - "
+_STEP_RE = re.compile(r"([^:]*):(.*?)(?: - (.*))?$", re.S)
+
+# MCP methods known to be free of side effects; only these are deduplicated.
+# Anything else, including unmapped actions passed through from the plan,
+# is treated as a write and always executed.
+_READ_ONLY_METHODS = frozenset({
+    "get_contacts", "get_groups",
+    "list_pull_requests", "get_repository",
+    "retrieve_memory", "search_knowledge_graph",
+    "list_directory", "read_file", "search_files",
+    "search", "news_search"
+})
+
+# Map of tool names to MCP server configurations (read-only, shared by all executors)
+_TOOL_MAPPING = MappingProxyType({
+    "whatsapp": MappingProxyType({
+        "server": "whatsapp-mcp-server",
+        "methods": MappingProxyType({
+            "send_message": "send_message",
+            "get_contacts": "get_contacts",
+            "get_groups": "get_groups"
+        })
+    }),
+    "github": MappingProxyType({
+        "server": "github",
+        "methods": MappingProxyType({
+            "list_prs": "list_pull_requests",
+            "create_issue": "create_issue",
+            "get_repo": "get_repository"
+        })
+    }),
+    "memory": MappingProxyType({
+        "server": "conversation-persistence-mcp",
+        "methods": MappingProxyType({
+            "store": "store_memory",
+            "retrieve": "retrieve_memory",
+            "search": "search_knowledge_graph"
+        })
+    }),
+    "terminal": MappingProxyType({
+        "server": "terminal",
+        "methods": MappingProxyType({
+            "execute": "execute_command",
+            "list_files": "list_directory"
+        })
+    }),
+    "search": MappingProxyType({
+        "server": "brave-search",
+        "methods": MappingProxyType({
+            "web_search": "search",
+            "news_search": "news_search"
+        })
+    }),
+    "filesystem": MappingProxyType({
+        "server": "filesystem",
+        "methods": MappingProxyType({
+            "list_files": "list_directory",
+            "read_file": "read_file",
+            "search_files": "search_files"
+        })
+    })
+})
+
+def _is_error_result(result: Any) -> bool:
+    """Check whether an MCP result is an error payload rather than data"""
+    return isinstance(result, dict) and "error" in result
+
+
 class ToolExecutor:
     """Executes tools via Supergateway"""
     
@@ -13,130 +90,133 @@ class ToolExecutor:
         self.supergateway = supergateway
         
         # Map of tool names to MCP server configurations
-        self.tool_mapping = {
-            "whatsapp": {
-                "server": "whatsapp-mcp-server",
-                "methods": {
-                    "send_message": "send_message",
-                    "get_contacts": "get_contacts",
-                    "get_groups": "get_groups"
-                }
-            },
-            "github": {
-                "server": "github",
-                "methods": {
-                    "list_prs": "list_pull_requests",
-                    "create_issue": "create_issue",
-                    "get_repo": "get_repository"
-                }
-            },
-            "memory": {
-                "server": "conversation-persistence-mcp",
-                "methods": {
-                    "store": "store_memory",
-                    "retrieve": "retrieve_memory",
-                    "search": "search_knowledge_graph"
-                }
-            },
-            "terminal": {
-                "server": "terminal",
-                "methods": {
-                    "execute": "execute_command",
-                    "list_files": "list_directory"
-                }
-            },
-            "search": {
-                "server": "brave-search",
-                "methods": {
-                    "web_search": "search",
-                    "news_search": "news_search"
-                }
-            },
-            "filesystem": {
-                "server": "filesystem",
-                "methods": {
-                    "list_files": "list_directory",
-                    "read_file": "read_file",
-                    "search_files": "search_files"
-                }
-            }
-        }
+        self.tool_mapping = _TOOL_MAPPING
     
     async def execute(self, state: ConversationState) -> ConversationState:
-        """Execute all planned steps"""
+        """Execute all planned steps, running independent read-only steps concurrently"""
+        
+        # Parse the remaining steps, skipping already completed ones
+        start = state.current_step
+        steps = {}
+        for offset, step in enumerate(state.plan[start:]):
+            steps[start + offset] = self._parse_step(step)
+        
+        # Identical read-only MCP calls within this execution share one result
+        call_cache: Dict[tuple, asyncio.Future] = {}
         
-        for i, step in enumerate(state.plan):
-            if state.current_step > i:
-                continue  # Skip already completed steps
+        # Run each wave of mutually independent steps concurrently
+        outcomes = {}
+        for wave in self._group_into_waves(steps):
+            results = await asyncio.gather(
+                *(self._execute_tool(steps[i]["tool"], steps[i]["action"], steps[i]["params"], state,
+                                     call_cache)
+                  for i in wave),
+                return_exceptions=True
+            )
+            outcomes.update(zip(wave, results))
+        
+        # Record outcomes in plan order; step_N is the 1-based plan position,
+        # matching the $step_N references the planner writes
+        for i in sorted(outcomes):
+            tool_info = steps[i]
+            result = outcomes[i]
             
-            try:
-                # Parse the step
-                tool_info = self._parse_step(step)
-                tool_name = tool_info["tool"]
-                action = tool_info["action"]
-                params = tool_info["params"]
-                
-                # Execute the tool
-                result = await self._execute_tool(tool_name, action, params, state)
-                
-                # Store result
-                state.tool_results[f"step_{i}"] = result
-                state.add_action(tool_name, action, result, success=True)
-                
-                # Update current step
-                state.current_step = i + 1
-                
-            except Exception as e:
-                error_msg = f"Step {i} failed: {str(e)}"
-                state.add_error(error_msg)
-                state.add_action(tool_info.get("tool", "unknown"), 
-                               tool_info.get("action", "unknown"), 
-                               str(e), success=False)
-                
-                # Continue with next step for now
-                state.current_step = i + 1
+            if isinstance(result, Exception):
+                state.add_error(f"Step {i + 1} failed: {str(result)}")
+                state.add_action(tool_info["tool"], tool_info["action"], str(result), success=False)
+            else:
+                # Store result; MCP servers report failures as {"error": ...}
+                state.tool_results[f"step_{i + 1}"] = result
+                state.add_action(tool_info["tool"], tool_info["action"], result,
+                                 success=not _is_error_result(result))
+        
+        # Failed steps are not retried
+        state.current_step = len(state.plan)
         
         return state
     
-    def _parse_step(self, step: str) -> Dict[str, Any]:
-        """Parse a plan step into tool, action, and parameters"""
+    def _group_into_waves(self, steps: Dict[int, Dict[str, Any]]) -> List[List[int]]:
+        """Group steps into waves of concurrently executable steps
+
+        A read-only step runs one wave after the last step it depends on. Any
+        other step may have side effects, so it keeps its plan position: it
+        runs alone, after every earlier step and before every later one.
+        """
         
-        # Expected format: "[Tool]: [Action] - [Parameters/Details]"
-        try:
-            if ':' in step:
-                tool_part, action_part = step.split(':', 1)
-                tool_name = tool_part.strip().lower()
-                
-                if ' - ' in action_part:
-                    action, params_str = action_part.split(' - ', 1)
-                    action = action.strip()
-                    params = {"details": params_str.strip()}
-                else:
-                    action = action_part.strip()
-                    params = {}
-                
-                return {
-                    "tool": tool_name,
-                    "action": action,
-                    "params": params
-                }
+        wave_of = {}
+        barrier = -1
+        for j, step_info in steps.items():
+            if self._is_read_only(step_info):
+                wave_of[j] = max([
+                    barrier + 1,
+                    *(wave_of[i] + 1 for i in wave_of if self._step_depends_on(i, step_info))
+                ])
             else:
-                # Fallback parsing
-                return {
-                    "tool": "memory",
-                    "action": "store",
-                    "params": {"content": step}
-                }
-        except Exception:
+                barrier = wave_of[j] = max(wave_of.values(), default=-1) + 1
+        
+        waves = [[] for _ in range(max(wave_of.values(), default=-1) + 1)]
+        for i, wave in wave_of.items():
+            waves[wave].append(i)
+        return waves
+    
+    def _is_read_only(self, step_info: Dict[str, Any]) -> bool:
+        """Check whether a parsed step maps to a side-effect-free MCP method"""
+        
+        tool_config = self.tool_mapping.get(step_info["tool"])
+        if tool_config is None:
+            return True  # Unknown tools are never called
+        method_name = tool_config["methods"].get(step_info["action"].lower(), step_info["action"])
+        return method_name in _READ_ONLY_METHODS
+    
+    def _step_depends_on(self, i: int, step_info: Dict[str, Any]) -> bool:
+        """Check whether a parsed step references the result of plan step i
+
+        The planner refers to earlier results as $step_N, N being the 1-based
+        step number in the plan.
+        """
+        return any(
+            int(ref) == i + 1
+            for value in step_info["params"].values() if isinstance(value, str)
+            for ref in _STEP_REF_RE.findall(value)
+        )
+    
+    def _parse_step(self, step: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Parse a plan step into tool, action, and parameters
+
+        Tool and action names are interned; they come from a small vocabulary
+        and are repeated in every recorded action and mapping lookup.
+        """
+        
+        # Structured steps from IntentPlanner only need normalizing
+        if isinstance(step, dict):
+            params = step.get("params") or {}
+            return {
+                "tool": sys.intern(str(step.get("tool", "memory")).strip().lower()),
+                "action": sys.intern(str(step.get("action", "store")).strip()),
+                "params": params if isinstance(params, dict) else {"details": str(params)}
+            }
+        
+        # Expected format: "[Tool]: [Action] - [Parameters/Details]"
+        match = _STEP_RE.match(step)
+        if not match:
+            # Fallback parsing
             return {
                 "tool": "memory",
-                "action": "store", 
+                "action": "store",
                 "params": {"content": step}
             }
+        
+        tool_part, action, details = match.groups()
+        return {
+            "tool": sys.intern(tool_part.strip().lower()),
+            "action": sys.intern(action.strip()),
+            "params": {"details": details.strip()} if details is not None else {}
+        }
     
     async def _execute_tool(self, tool_name: str, action: str, params: Dict[str, Any], 
-                          state: ConversationState) -> Any:
-        """Execute a specific tool action"""
+                          state: ConversationState,
+                          call_cache: Optional[Dict[tuple, asyncio.Future]] = None) -> Any:
+        """Execute a specific tool action, reusing identical read-only calls from call_cache"""
         
         if tool_name not in self.tool_mapping:
             return f"Tool {tool_name} not available"
@@ -150,55 +230,80 @@ class ToolExecutor:
         # Prepare parameters based on tool and action
         mcp_params = self._prepare_params(tool_name, action, params, state)
         
-        # Execute via Supergateway
-        result = await self.supergateway.execute_mcp(server_name, method_name, mcp_params)
+        if call_cache is None or method_name not in _READ_ONLY_METHODS:
+            # Execute via Supergateway
+            return await self.supergateway.execute_mcp(server_name, method_name, mcp_params)
         
-        return result
+        # Cache the in-flight call so concurrent duplicates await the same request
+        key = (server_name, method_name, json.dumps(mcp_params, sort_keys=True, default=str))
+        if key not in call_cache:
+            call_cache[key] = asyncio.ensure_future(
+                self.supergateway.execute_mcp(server_name, method_name, mcp_params)
+            )
+        return await call_cache[key]
     
     def _prepare_params(self, tool_name: str, action: str, params: Dict[str, Any], 
                        state: ConversationState) -> Dict[str, Any]:
         """Prepare parameters for MCP server calls"""
         
-        if tool_name == "whatsapp":
-            if "send_message" in action.lower():
-                return {
-                    "to": params.get("to", ""),
-                    "message": params.get("message", state.current_message)
-                }
-            else:
-                return params
-                
-        elif tool_name == "github":
-            if "list_prs" in action.lower() or "pull_request" in action.lower():
-                return {
-                    "owner": params.get("owner", state.context.get("github_owner", "")),
-                    "repo": params.get("repo", state.context.get("github_repo", ""))
-                }
-            else:
-                return params
-                
-        elif tool_name == "memory":
-            return {
-                "content": params.get("content", state.current_message),
-                "user_id": state.user_id,
-                "session_id": state.session_id
-            }
-            
-        elif tool_name == "filesystem":
-            if "list" in action.lower():
-                # Extract path from params or use desktop as default
-                path = params.get("path", "/Users/mohit/Desktop")
-                if "desktop" in state.current_message.lower():
-                    path = "/Users/mohit/Desktop"
-                elif "downloads" in state.current_message.lower():
-                    path = "/Users/mohit/Downloads"
-                elif "documents" in state.current_message.lower():
-                    path = "/Users/mohit/Documents"
-                return {"path": path}
-            elif "read" in action.lower():
-                return {"path": params.get("path", "")}
-            else:
-                return params
-            
-        else:
-            return params
\ No newline at end of file
+        handler = _PARAM_HANDLERS.get(tool_name)
+        if handler is None:
+            return params
+        return handler(action.lower(), params, state)
+
+
+# Well-known folders, checked in order against the user's message
+_PATH_MAP = {
+    "desktop": "/Users/mohit/Desktop",
+    "downloads": "/Users/mohit/Downloads",
+    "documents": "/Users/mohit/Documents"
+}
+
+
+def _prep_whatsapp(action: str, params: Dict[str, Any], state: ConversationState) -> Dict[str, Any]:
+    if "send_message" in action:
+        return {
+            "to": params.get("to", ""),
+            "message": params.get("message", state.current_message)
+        }
+    return params
+
+
+def _prep_github(action: str, params: Dict[str, Any], state: ConversationState) -> Dict[str, Any]:
+    if "list_prs" in action or "pull_request" in action:
+        return {
+            "owner": params.get("owner", state.context.get("github_owner", "")),
+            "repo": params.get("repo", state.context.get("github_repo", ""))
+        }
+    return params
+
+
+def _prep_memory(action: str, params: Dict[str, Any], state: ConversationState) -> Dict[str, Any]:
+    return {
+        "content": params.get("content", state.current_message),
+        "user_id": state.user_id,
+        "session_id": state.session_id
+    }
+
+
+def _prep_filesystem(action: str, params: Dict[str, Any], state: ConversationState) -> Dict[str, Any]:
+    if "list" in action:
+        # A folder named in the message wins over the path param; desktop is the default
+        message = state.current_message.lower()
+        path = next(
+            (folder for keyword, folder in _PATH_MAP.items() if keyword in message),
+            params.get("path", _PATH_MAP["desktop"])
+        )
+        return {"path": path}
+    elif "read" in action:
+        return {"path": params.get("path", "")}
+    return params
+
+
+# Per-tool parameter preparation, keyed by tool name
+_PARAM_HANDLERS: Dict[str, Callable[[str, Dict[str, Any], ConversationState], Dict[str, Any]]] = {
+    "whatsapp": _prep_whatsapp,
+    "github": _prep_github,
+    "memory": _prep_memory,
+    "filesystem": _prep_filesystem
+}
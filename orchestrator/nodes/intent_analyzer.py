@@ -2,17 +2,16 @@
 Intent Analysis Node - Determines what the user wants to do
 """
 
+import re
 from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from ..state import ConversationState
+from langchain.schema import HumanMessage, SystemMessage
+from langchain_core.output_parsers import StrOutputParser
+from ..state import ConversationState, serialize_context
 
-class IntentAnalyzer:
-    """Analyzes user intent and categorizes requests"""
-    
-    def __init__(self, llm: ChatOpenAI):
-        self.llm = llm
-        self.intent_prompt = PromptTemplate.from_template("""
-You are analyzing user intent for a Personal AI Brain system that has access to 35+ tools.
+# "KEY: value" lines of the intent response format
+_INTENT_RE = re.compile(r"^(INTENT|TOOLS|COMPLEXITY|EXPLANATION):[ \t]*(.*)$", re.M)
+
+_INTENT_SYSTEM_PROMPT = """You are analyzing user intent for a Personal AI Brain system that has access to 35+ tools.
 
 Available tool categories:
 - COMMUNICATION: WhatsApp, Slack, Email, Telegram
@@ -23,9 +22,6 @@ Available tool categories:
 - CREATIVE: Content generation, analysis
 - FILESYSTEM: List files, read files, search files
 
-User message: "{message}"
-Previous context: {context}
-
 Analyze the intent and respond with:
 1. Primary intent (one word: communication, development, data, memory, search, creative, complex)
 2. Required tools (list the specific tools needed)
@@ -36,21 +32,34 @@ Format:
 INTENT: [intent]
 TOOLS: [tool1, tool2, ...]
 COMPLEXITY: [level]
-EXPLANATION: [brief explanation]
-""")
+EXPLANATION: [brief explanation]"""
+
+_INTENT_HUMAN_PROMPT = """User message: "{message}"
+Previous context: {context}"""
+_format_intent_request = _INTENT_HUMAN_PROMPT.format_map
+
+class IntentAnalyzer:
+    """Analyzes user intent and categorizes requests"""
+    
+    def __init__(self, llm: ChatOpenAI):
+        self.llm = llm
+        # Only the user message and context change between calls
+        self._system_message = SystemMessage(content=_INTENT_SYSTEM_PROMPT)
+        self.chain = llm | StrOutputParser()
     
     async def analyze(self, state: ConversationState) -> ConversationState:
         """Analyze user intent"""
         
         try:
-            # Format the prompt
-            prompt = self.intent_prompt.format(
-                message=state.current_message,
-                context=str(state.context)
-            )
-            
+            request = _format_intent_request({
+                "message": state.current_message,
+                "context": serialize_context(state.context)
+            })
             # Get LLM response
-            response = await self.llm.apredict(prompt)
+            response = await self.chain.ainvoke([
+                self._system_message,
+                HumanMessage(content=request)
+            ])
             
             # Parse the response
             intent_data = self._parse_intent_response(response)
@@ -72,17 +81,12 @@ EXPLANATION: [brief explanation]
         """Parse the LLM response into structured data"""
         
         result = {}
-        lines = response.strip().split('\n')
         
-        for line in lines:
-            if line.startswith("INTENT:"):
-                result["intent"] = line.split(":", 1)[1].strip()
-            elif line.startswith("TOOLS:"):
-                tools_str = line.split(":", 1)[1].strip()
-                result["tools"] = [tool.strip() for tool in tools_str.split(",") if tool.strip()]
-            elif line.startswith("COMPLEXITY:"):
-                result["complexity"] = line.split(":", 1)[1].strip()
-            elif line.startswith("EXPLANATION:"):
-                result["explanation"] = line.split(":", 1)[1].strip()
+        for match in _INTENT_RE.finditer(response):
+            key, value = match.group(1).lower(), match.group(2).strip()
+            if key == "tools":
+                result["tools"] = [tool.strip() for tool in value.split(",") if tool.strip()]
+            else:
+                result[key] = value
         
         return result
\ No newline at end of file
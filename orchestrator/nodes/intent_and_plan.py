@@ -0,0 +1,98 @@
+"""
+Intent and Planning Node - Determines what the user wants and plans it in one LLM call
+"""
+
+from langchain_openai import ChatOpenAI
+from langchain.schema import HumanMessage, SystemMessage
+from langchain_core.output_parsers import StrOutputParser
+import orjson
+from ..state import ConversationState, serialize_context
+
+_INTENT_AND_PLAN_SYSTEM_PROMPT = """You are analyzing user intent and planning a workflow for a Personal AI Brain system that has access to 35+ tools.
+
+Available tool categories:
+- COMMUNICATION: WhatsApp, Slack, Email, Telegram
+- DEVELOPMENT: GitHub, Docker, Jenkins, Terminal
+- DATA: BigQuery, Shopify, AWS, Google Sheets
+- MEMORY: Knowledge graph, context storage
+- SEARCH: Web search, document search
+- CREATIVE: Content generation, analysis
+- FILESYSTEM: List files, read files, search files
+
+Determine:
+1. Primary intent (one word: communication, development, data, memory, search, creative, complex)
+2. Required tools (the specific tools needed)
+3. Complexity level (simple, medium, complex)
+4. A step-by-step execution plan where each step uses one primary tool and
+   includes the parameters it needs
+
+If a step needs the result of an earlier step, reference it as $step_N in its
+parameters, where N is that step's number (starting at 1). Steps without such a
+reference may run in parallel.
+
+Respond with a single JSON object and nothing else:
+{"intent": "...", "tools": ["..."], "complexity": "...", "explanation": "...",
+ "plan": [{"tool": "...", "action": "...", "params": {"details": "..."}}]}"""
+
+_INTENT_AND_PLAN_HUMAN_PROMPT = """User message: "{message}"
+Previous context: {context}"""
+_format_intent_and_plan_request = _INTENT_AND_PLAN_HUMAN_PROMPT.format_map
+
+class IntentPlanner:
+    """Analyzes user intent and plans the workflow steps in a single request"""
+    
+    def __init__(self, llm: ChatOpenAI):
+        self.llm = llm
+        # Only the user message and context change between calls
+        self._system_message = SystemMessage(content=_INTENT_AND_PLAN_SYSTEM_PROMPT)
+        self.chain = llm | StrOutputParser()
+    
+    async def analyze_and_plan(self, state: ConversationState) -> ConversationState:
+        """Analyze user intent and create the execution plan"""
+        
+        try:
+            request = _format_intent_and_plan_request({
+                "message": state.current_message,
+                "context": serialize_context(state.context)
+            })
+            # Get LLM response
+            response = await self.chain.ainvoke([
+                self._system_message,
+                HumanMessage(content=request)
+            ])
+        
+            # Parse the response
+            data = self._parse_response(response)
+        
+            # Update state
+            state.intent = data.get("intent", "unknown")
+            state.tools_to_use = data.get("tools", [])
+            state.context["complexity"] = data.get("complexity", "medium")
+            state.context["explanation"] = data.get("explanation", "")
+            state.plan = [step for step in data.get("plan", []) if isinstance(step, dict)]
+            state.current_step = 0
+        
+        except Exception as e:
+            state.add_error(f"Intent analysis and planning failed: {str(e)}")
+            state.intent = "fallback"
+            state.tools_to_use = ["memory"]  # Safe fallback
+            # Create a simple fallback plan
+            state.plan = [
+                "memory: Store conversation context",
+                "response: Generate simple response"
+            ]
+        
+        return state
+    
+    def _parse_response(self, response: str) -> dict:
+        """Parse the JSON object in the LLM response"""
+        
+        # Tolerate surrounding prose or a fenced code block around the object
+        start, end = response.find("{"), response.rfind("}")
+        if start == -1 or end < start:
+            raise ValueError("No JSON object in response")
+        
+        data = orjson.loads(response[start:end + 1])
+        if not isinstance(data, dict):
+            raise ValueError("Response is not a JSON object")
+        return data
@@ -2,22 +2,16 @@
 Workflow Planning Node - Creates execution plan based on intent
 """
 
+import re
 from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from ..state import ConversationState
+from langchain.schema import HumanMessage, SystemMessage
+from langchain_core.output_parsers import StrOutputParser
+from ..state import ConversationState, serialize_context
 
-class WorkflowPlanner:
-    """Plans the workflow execution steps"""
-    
-    def __init__(self, llm: ChatOpenAI):
-        self.llm = llm
-        self.planning_prompt = PromptTemplate.from_template("""
-You are planning a workflow for a Personal AI Brain system.
+# One plan step per numbered or bulleted line
+_PLAN_RE = re.compile(r"^[ \t]*(?:\d+[.)]|[-*])[ \t]+(.+?)\s*$", re.M)
 
-User Intent: {intent}
-Required Tools: {tools}
-User Message: "{message}"
-Context: {context}
+_PLANNING_SYSTEM_PROMPT = """You are planning a workflow for a Personal AI Brain system.
 
 Create a step-by-step execution plan. Each step should be:
 1. Clear and actionable
@@ -25,36 +19,56 @@ Create a step-by-step execution plan. Each step should be:
 3. Include necessary parameters
 4. Consider dependencies between steps
 
+If a step needs the result of an earlier step, reference it as $step_N in its
+details, where N is that step's number. Steps without such a reference may run
+in parallel.
+
 For example:
 - If user wants to "check GitHub PRs and send summary to team"
 - Step 1: Get GitHub pull requests (github tool)
-- Step 2: Analyze PR status (analysis)
-- Step 3: Format summary (formatting)
+- Step 2: Analyze PR status of $step_1 (analysis)
+- Step 3: Format summary of $step_2 (formatting)
 - Step 4: Get team contacts (memory tool)
-- Step 5: Send WhatsApp message (whatsapp tool)
+- Step 5: Send WhatsApp message with $step_3 to $step_4 (whatsapp tool)
+Steps 1 and 4 run in parallel; step 5 waits for both inputs.
 
 Format your response as a numbered list:
 1. [Tool]: [Action] - [Parameters/Details]
 2. [Tool]: [Action] - [Parameters/Details]
-...
+..."""
+
+_PLANNING_HUMAN_PROMPT = """User Intent: {intent}
+Required Tools: {tools}
+User Message: "{message}"
+Context: {context}
+
+Plan:"""
+_format_planning_request = _PLANNING_HUMAN_PROMPT.format_map
 
-Plan:
-""")
+class WorkflowPlanner:
+    """Plans the workflow execution steps"""
+    
+    def __init__(self, llm: ChatOpenAI):
+        self.llm = llm
+        # Only the intent, tools, message and context change between calls
+        self._system_message = SystemMessage(content=_PLANNING_SYSTEM_PROMPT)
+        self.chain = llm | StrOutputParser()
     
     async def plan(self, state: ConversationState) -> ConversationState:
         """Create execution plan"""
         
         try:
-            # Format the prompt
-            prompt = self.planning_prompt.format(
-                intent=state.intent,
-                tools=", ".join(state.tools_to_use),
-                message=state.current_message,
-                context=str(state.context)
-            )
-            
+            request = _format_planning_request({
+                "intent": state.intent,
+                "tools": ", ".join(state.tools_to_use),
+                "message": state.current_message,
+                "context": serialize_context(state.context)
+            })
             # Get LLM response
-            response = await self.llm.apredict(prompt)
+            response = await self.chain.ainvoke([
+                self._system_message,
+                HumanMessage(content=request)
+            ])
             
             # Parse the plan
             plan_steps = self._parse_plan_response(response)
@@ -76,17 +90,5 @@ Plan:
     def _parse_plan_response(self, response: str) -> list:
         """Parse the LLM response into plan steps"""
         
-        steps = []
-        lines = response.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if line and (line[0].isdigit() or line.startswith('-')):
-                # Remove numbering and clean up
-                step = line.split('.', 1)[-1].strip()
-                if step.startswith('-'):
-                    step = step[1:].strip()
-                if step:
-                    steps.append(step)
-        
-        return steps
\ No newline at end of file
+        # Numbered ("1." / "1)") or bulleted ("-" / "*") lines, numbering removed
+        return [match.group(1) for match in _PLAN_RE.finditer(response)]
\ No newline at end of file
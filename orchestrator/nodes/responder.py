@@ -2,30 +2,52 @@
 Response Generation Node - Creates user-friendly responses
 """
 
+import io
+from itertools import islice
 from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate
+from langchain.schema import HumanMessage, SystemMessage
+from langchain_core.output_parsers import StrOutputParser
+import orjson
 from ..state import ConversationState
 
-class ResponseGenerator:
-    """Generates appropriate responses based on execution results"""
-    
-    def __init__(self, llm: ChatOpenAI):
-        self.llm = llm
-        self.response_prompt = PromptTemplate.from_template("""
-You are generating a response for a Personal AI Brain system.
+# Canned confirmations for a single successful memory store, keyed by interface
+_STORE_CONFIRMATIONS = {
+    "voice": "Done, I'll remember that.",
+    "phone": "Done, I'll remember that.",
+    "whatsapp": "✅ Saved that for you",
+}
+_DEFAULT_STORE_CONFIRMATION = "Stored successfully."
 
-Original user message: "{message}"
-User interface: {interface}
-Intent: {intent}
-Actions taken: {actions}
-Tool results: {results}
-Errors (if any): {errors}
+# Containers with more items than this are summarized by size instead of content
+_MAX_RENDERED_ITEMS = 32
+
+# Result previews keep this many characters of each string and entries of each nested container
+_PREVIEW_CHARS = 100
+_PREVIEW_NESTED_ITEMS = 8
+
+
+def _preview(value, depth: int = 1):
+    """Bounded copy of a result value: strings truncated, nested containers cut short"""
+    if isinstance(value, str):
+        return value[:_PREVIEW_CHARS]
+    if isinstance(value, dict):
+        if depth <= 0:
+            return f"<dict len={len(value)}>"
+        return {k: _preview(v, depth - 1) for k, v in islice(value.items(), _PREVIEW_NESTED_ITEMS)}
+    if isinstance(value, (list, tuple)):
+        if depth <= 0:
+            return f"<{type(value).__name__} len={len(value)}>"
+        return [_preview(v, depth - 1) for v in islice(value, _PREVIEW_NESTED_ITEMS)]
+    return value
+
+
+_RESPONSE_SYSTEM_PROMPT = """You are generating a response for a Personal AI Brain system.
 
 Generate an appropriate response that:
 1. Acknowledges what the user asked for
 2. Summarizes what was done
 3. Provides relevant results or information
-4. Is appropriate for the interface ({interface})
+4. Is appropriate for the user interface
 5. Is friendly and conversational
 
 If there were errors, acknowledge them but focus on what was accomplished.
@@ -34,43 +56,60 @@ Response format guidelines:
 - Voice interface: Keep it concise and speakable
 - WhatsApp: Use emojis and informal tone
 - Web/API: More detailed and structured
-- All interfaces: Be helpful and clear
+- All interfaces: Be helpful and clear"""
 
-Response:
-""")
+_RESPONSE_HUMAN_PROMPT = """Original user message: "{message}"
+User interface: {interface}
+Intent: {intent}
+Actions taken: {actions}
+Tool results: {results}
+Errors (if any): {errors}
+
+Response:"""
+_format_response_request = _RESPONSE_HUMAN_PROMPT.format_map
+
+class ResponseGenerator:
+    """Generates appropriate responses based on execution results"""
+    
+    def __init__(self, llm: ChatOpenAI):
+        self.llm = llm
+        # Only the request details and execution results change between calls
+        self._system_message = SystemMessage(content=_RESPONSE_SYSTEM_PROMPT)
+        self.chain = llm | StrOutputParser()
     
     async def generate(self, state: ConversationState) -> ConversationState:
         """Generate appropriate response"""
         
+        # Confirmations whose wording is fully determined by the state skip the LLM
+        if self._can_template(state):
+            state.response = self._render_template(state)
+            self._set_response_type(state)
+            return state
+        
         try:
             # Prepare response data
             actions_summary = self._summarize_actions(state.actions_taken)
             results_summary = self._summarize_results(state.tool_results)
             errors_summary = self._summarize_errors(state.errors)
             
-            # Format the prompt
-            prompt = self.response_prompt.format(
-                message=state.current_message,
-                interface=state.interface,
-                intent=state.intent,
-                actions=actions_summary,
-                results=results_summary,
-                errors=errors_summary
-            )
-            
+            request = _format_response_request({
+                "message": state.current_message,
+                "interface": state.interface,
+                "intent": state.intent,
+                "actions": actions_summary,
+                "results": results_summary,
+                "errors": errors_summary
+            })
             # Generate response
-            response = await self.llm.apredict(prompt)
+            response = await self.chain.ainvoke([
+                self._system_message,
+                HumanMessage(content=request)
+            ])
             
             # Clean up the response
             state.response = response.strip()
             
-            # Set response type based on interface
-            if state.interface in ["voice", "phone"]:
-                state.response_type = "voice"
-            elif state.interface == "whatsapp":
-                state.response_type = "chat"
-            else:
-                state.response_type = "text"
+            self._set_response_type(state)
                 
         except Exception as e:
             state.add_error(f"Response generation failed: {str(e)}")
@@ -78,6 +117,31 @@ Response:
         
         return state
     
+    def _set_response_type(self, state: ConversationState):
+        """Set response type based on interface"""
+        if state.interface in ["voice", "phone"]:
+            state.response_type = "voice"
+        elif state.interface == "whatsapp":
+            state.response_type = "chat"
+        else:
+            state.response_type = "text"
+    
+    def _can_template(self, state: ConversationState) -> bool:
+        """Check whether the response is a plain confirmation of one memory store"""
+        if state.intent != "memory" or state.errors or len(state.actions_taken) != 1:
+            return False
+        if any(isinstance(result, dict) and "error" in result
+               for result in state.tool_results.values()):
+            return False
+        action = state.actions_taken[0]
+        return (action.get("success", False)
+                and action.get("tool") == "memory"
+                and action.get("action", "").lower() == "store")
+    
+    def _render_template(self, state: ConversationState) -> str:
+        """Render the canned confirmation for the user's interface"""
+        return _STORE_CONFIRMATIONS.get(state.interface, _DEFAULT_STORE_CONFIRMATION)
+    
     def _summarize_actions(self, actions: list) -> str:
         """Summarize actions taken"""
         if not actions:
@@ -98,17 +162,38 @@ Response:
         if not results:
             return "No results"
         
-        summary_parts = []
+        # Only the first 100 characters of each result are used, so results
+        # are rendered from bounded previews, never in full
+        summary = io.StringIO()
         for key, result in results.items():
+            if summary.tell():
+                summary.write("; ")
             if isinstance(result, dict):
                 if "error" in result:
-                    summary_parts.append(f"{key}: Error - {result['error']}")
+                    summary.write(f"{key}: Error - {result['error']}")
                 else:
-                    summary_parts.append(f"{key}: Success with data")
+                    summary.write(f"{key}: Success with data")
+            elif isinstance(result, str):
+                summary.write(f"{key}: {result[:100]}...")
+            elif isinstance(result, (list, tuple)):
+                placeholder = f"{key}: <{type(result).__name__} len={len(result)}>"
+                if len(result) > _MAX_RENDERED_ITEMS:
+                    summary.write(placeholder)
+                    continue
+                try:
+                    rendered = orjson.dumps(
+                        [_preview(item) for item in result],
+                        default=str,
+                        option=orjson.OPT_NON_STR_KEYS
+                    ).decode()
+                except orjson.JSONEncodeError:
+                    summary.write(placeholder)
+                else:
+                    summary.write(f"{key}: {rendered[:100]}...")
             else:
-                summary_parts.append(f"{key}: {str(result)[:100]}...")
+                summary.write(f"{key}: {str(result)[:100]}...")
         
-        return "; ".join(summary_parts)
+        return summary.getvalue()
     
     def _summarize_errors(self, errors: list) -> str:
         """Summarize errors"""
@@ -2,11 +2,31 @@
 Conversation state management for LangGraph workflows
 """
 
-from typing import Dict, Any, List, Optional
-from pydantic import BaseModel
+from typing import Deque, Dict, Any, List, Optional, TypedDict, Union
+from collections import deque
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
+import time
 
-class ConversationState(BaseModel):
+import orjson
+
+# History kept on a live state; older entries are dropped as new ones arrive
+MAX_MESSAGES = 128
+MAX_ACTIONS = 64
+MAX_ERRORS = 32
+
+
+def serialize_context(context: Dict[str, Any]) -> str:
+    """Serialize a context dict for prompts with a stable key order"""
+    return orjson.dumps(
+        context,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str
+    ).decode()
+
+
+@dataclass(slots=True)
+class ConversationState:
     """State object passed through LangGraph nodes"""
     
     # Core conversation data
@@ -15,37 +35,34 @@ class ConversationState(BaseModel):
     interface: str  # voice, whatsapp, web, api
     
     # Message history
-    messages: List[Dict[str, Any]] = []
+    messages: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=MAX_MESSAGES))
     current_message: str = ""
     
     # Intent and planning
     intent: Optional[str] = None
-    plan: List[str] = []
+    plan: List[Union[str, Dict[str, Any]]] = field(default_factory=list)  # text or structured steps
     current_step: int = 0
     
     # Tool execution
-    tools_to_use: List[str] = []
-    tool_results: Dict[str, Any] = {}
-    actions_taken: List[Dict[str, Any]] = []
+    tools_to_use: List[str] = field(default_factory=list)
+    tool_results: Dict[str, Any] = field(default_factory=dict)
+    actions_taken: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=MAX_ACTIONS))
     
     # Context and memory
-    context: Dict[str, Any] = {}
-    memory_retrieved: Dict[str, Any] = {}
+    context: Dict[str, Any] = field(default_factory=dict)
+    memory_retrieved: Dict[str, Any] = field(default_factory=dict)
     
     # Response generation
     response: str = ""
     response_type: str = "text"  # text, voice, rich
     
     # Error handling
-    errors: List[str] = []
+    errors: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_ERRORS))
     retry_count: int = 0
     
-    # Timestamps
-    start_time: datetime = datetime.now()
-    last_updated: datetime = datetime.now()
-    
-    class Config:
-        arbitrary_types_allowed = True
+    # Timestamps (time.monotonic() seconds, set per instance)
+    start_time: float = field(default_factory=time.monotonic)
+    last_updated: float = field(default_factory=time.monotonic)
     
     def add_message(self, role: str, content: str):
         """Add a message to the conversation history"""
@@ -54,7 +71,7 @@ class ConversationState(BaseModel):
             "content": content,
             "timestamp": datetime.now().isoformat()
         })
-        self.last_updated = datetime.now()
+        self.last_updated = time.monotonic()
     
     def add_action(self, tool: str, action: str, result: Any, success: bool = True):
         """Record an action taken during orchestration"""
@@ -65,22 +82,29 @@ class ConversationState(BaseModel):
             "success": success,
             "timestamp": datetime.now().isoformat()
         })
-        self.last_updated = datetime.now()
+        self.last_updated = time.monotonic()
     
     def add_error(self, error: str):
         """Add an error to the state"""
         self.errors.append(error)
-        self.last_updated = datetime.now()
+        self.last_updated = time.monotonic()
     
     def update_context(self, key: str, value: Any):
         """Update context with new information"""
         self.context[key] = value
-        self.last_updated = datetime.now()
+        self.last_updated = time.monotonic()
     
     def is_complete(self) -> bool:
         """Check if the workflow is complete"""
         return len(self.plan) > 0 and self.current_step >= len(self.plan)
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the state to a plain dict (e.g. the LangGraph graph state)"""
+        data = asdict(self)
+        for key in ("messages", "actions_taken", "errors"):
+            data[key] = list(data[key])
+        return data
+    
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of the current state"""
         return {
@@ -92,5 +116,33 @@ class ConversationState(BaseModel):
             "tools_used": list(self.tool_results.keys()),
             "actions_count": len(self.actions_taken),
             "errors_count": len(self.errors),
-            "duration": (self.last_updated - self.start_time).total_seconds()
-        }
\ No newline at end of file
+            "duration": self.last_updated - self.start_time
+        }
+
+
+class ConversationStateDict(TypedDict, total=False):
+    """Plain-dict mirror of ConversationState used as the LangGraph graph state.
+
+    LangGraph merges the partial dicts returned by each node without running
+    model validation, so nodes only return the keys they change.
+    """
+    
+    user_id: str
+    session_id: str
+    interface: str
+    messages: List[Dict[str, Any]]
+    current_message: str
+    intent: Optional[str]
+    plan: List[Union[str, Dict[str, Any]]]
+    current_step: int
+    tools_to_use: List[str]
+    tool_results: Dict[str, Any]
+    actions_taken: List[Dict[str, Any]]
+    context: Dict[str, Any]
+    memory_retrieved: Dict[str, Any]
+    response: str
+    response_type: str
+    errors: List[str]
+    retry_count: int
+    start_time: float
+    last_updated: float